@@ -19,18 +19,77 @@ Usage:
 """
 
 import base64
+import gc
 import io
-import json
+import os
 import re
 import sys
+from bisect import bisect_left, bisect_right
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 import click
 import pdfplumber
 from PIL import Image
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, TypeAdapter
+
+# Runs of whitespace (including newlines) collapsed when cleaning extracted text
+_WS_RE = re.compile(r'\s+')
+
+# Header words that start a column label, looked up once per word in scan_pages
+_HEADER_ACTIONS = {
+    'Frage': 'frage',
+    'Richtige': 'richtige',
+    'Antwort': 'antwort',
+}
+
+# PageHeaders field set by "Antwort" followed by the answer letter
+_ANSWER_HEADER_FIELDS = {
+    'A': 'antwort_a_x',
+    'B': 'antwort_b_x',
+    'C': 'antwort_c_x',
+}
+
+# File extensions for image encodings that stream.get_data() leaves encoded
+_FILTER_EXT = {
+    'DCTDecode': 'jpg',
+    'DCT': 'jpg',
+    'JPEG': 'jpg',
+    'JPXDecode': 'jp2',
+    'JPX': 'jp2',
+}
+
+
+def _image_extension(img_filter) -> str:
+    """Map a PDF image stream's Filter entry to a file extension (default png).
+
+    For a filter chain the last filter decides: the ones before it (e.g.
+    ASCII85Decode) are undone by get_data(), the last one is the image format.
+    """
+    if isinstance(img_filter, list):
+        img_filter = img_filter[-1] if img_filter else ''
+    name = getattr(img_filter, 'name', img_filter)
+    if isinstance(name, bytes):
+        name = name.decode('latin-1')
+    return _FILTER_EXT.get(str(name).lstrip('/'), 'png')
+
+
+def _is_anchor(text: str) -> bool:
+    """Check whether a word is a question number anchor.
+
+    Supports two formats:
+    - Regular questions: 1.001, 1.002, 2.001, etc. (exactly three decimals)
+    - Picture questions: B2.1, B2.2, B3.1, etc.
+    """
+    picture = text[:1] == 'B'
+    head, dot, tail = text[1:].partition('.') if picture else text.partition('.')
+    if not (dot and head.isdecimal() and tail.isdecimal()):
+        return False
+    return picture or len(tail) == 3
 
 
 class ColumnHeader(BaseModel):
@@ -50,7 +109,7 @@ class PageHeaders(BaseModel):
     richtige_antwort_x: Optional[float] = None
 
 
-class QuestionAnchor(BaseModel):
+class QuestionAnchor(NamedTuple):
     """Question number anchor with position."""
     number: str
     page: int
@@ -62,16 +121,17 @@ class QuestionAnchor(BaseModel):
     y1: float
 
 
-class QuestionRegion(BaseModel):
+class QuestionRegion(NamedTuple):
     """Defines a bounding box for extracting question text."""
     anchor: QuestionAnchor
-    x_start: float = Field(description="Left edge (Frage column)")
-    x_end: float = Field(description="Right edge (Antwort A column)")
-    y_start: float = Field(description="Top edge (question anchor)")
-    y_end: float = Field(description="Bottom edge (next question anchor or page bottom)")
+    x_start: float  # Left edge (Frage column)
+    x_end: float  # Right edge (Antwort A column)
+    y_start: float  # Top edge (question anchor)
+    y_end: float  # Bottom edge (next question anchor or page bottom)
+    bbox: Tuple[float, float, float, float]  # (x_start, y_start, x_end, y_end)
 
 
-class ExtractedQuestion(BaseModel):
+class ExtractedQuestion(NamedTuple):
     """Extracted question with text."""
     number: str
     page: int
@@ -79,17 +139,18 @@ class ExtractedQuestion(BaseModel):
     region: Optional[QuestionRegion] = None
 
 
-class AnswerRegion(BaseModel):
+class AnswerRegion(NamedTuple):
     """Defines a bounding box for extracting answer text."""
     anchor: QuestionAnchor
-    answer_letter: str = Field(description="'A', 'B', or 'C'")
+    answer_letter: str  # 'A', 'B', or 'C'
     x_start: float
-    x_end: float
+    x_end: float  # Answer C extends to the page edge
     y_start: float
     y_end: float
+    bbox: Tuple[float, float, float, float]  # (x_start, y_start, x_end, y_end)
 
 
-class ExtractedAnswer(BaseModel):
+class ExtractedAnswer(NamedTuple):
     """Extracted answer with text."""
     question_number: str
     page: int
@@ -123,6 +184,171 @@ class ExamOutput(BaseModel):
     images: List[ImageOutput]
 
 
+# Serializes ExamOutput straight to UTF-8 JSON bytes (no str round trip)
+_EXAM_OUTPUT_ADAPTER = TypeAdapter(ExamOutput)
+
+
+def _group_by_page(items: list, page_of=attrgetter('page')) -> Dict[int, list]:
+    """Group items by page number, keeping their order within each page."""
+    grouped = defaultdict(list)
+    for item in items:
+        grouped[page_of(item)].append(item)
+    return grouped
+
+
+def _y_ends(page_anchors: List[QuestionAnchor], page_height: float) -> List[float]:
+    """Bottom edge of each anchor's row: the next anchor's Y, or the page bottom."""
+    return [a.y for a in page_anchors[1:]] + [page_height]
+
+
+def _anchors_by_page(anchors: List[QuestionAnchor]) -> Dict[int, List[QuestionAnchor]]:
+    """Group anchors by page, with each page's anchors sorted top to bottom."""
+    return _group_by_page(sorted(anchors, key=attrgetter('page', 'y')))
+
+
+class PageWork(NamedTuple):
+    """Everything needed to extract the regions of a single page."""
+    page_num: int
+    question_regions: List[QuestionRegion]
+    answer_regions: List[AnswerRegion]
+    anchors: List[QuestionAnchor]  # Sorted by Y coordinate
+    correct_answer_x: Optional[float]  # 'Richtige Antwort' column, if known
+
+
+def _region_text(chars: List[dict], tops: List[float], bbox: tuple) -> str:
+    """Extract text from chars fully inside bbox (x0, top, x1, bottom).
+
+    Equivalent to ``page.within_bbox(bbox).extract_text()`` but works on the
+    page's top-sorted char list: the vertical slice is found by bisection and
+    only that slice is filtered, instead of building a CroppedPage per region.
+    """
+    x0, top, x1, bottom = bbox
+    band = chars[bisect_left(tops, top):bisect_right(tops, bottom)]
+    region_chars = [c for c in band if c['x0'] >= x0 and c['x1'] <= x1 and c['bottom'] <= bottom]
+    return pdfplumber.utils.extract_text(region_chars)
+
+
+def _extract_page(
+    page: pdfplumber.page.Page,
+    work: PageWork
+) -> Tuple[List[ExtractedQuestion], List[ExtractedAnswer], Dict[str, str], List[str]]:
+    """Extract questions, answers and correct answers from one page.
+
+    Returns the extracted items plus the log messages for the page, so that
+    the caller can print them in page order.
+    """
+    extracted_questions = []
+    extracted_answers = []
+    correct_answers = {}
+    messages = []
+
+    page_height = page.height
+    page_width = page.width
+
+    # Materialize the page's chars once, sorted by top for bisection
+    chars = sorted(page.chars, key=itemgetter('top'))
+    tops = [c['top'] for c in chars]
+
+    # Questions
+    for region in work.question_regions:
+        # Extract text from region
+        text = _region_text(chars, tops, region.bbox)
+
+        if text:
+            # Clean up text (remove extra whitespace, newlines)
+            text = _WS_RE.sub(' ', text).strip()
+
+        extracted_questions.append(ExtractedQuestion(
+            number=region.anchor.number,
+            page=region.anchor.page,
+            text=text or "",
+            region=region
+        ))
+
+    # Answers A, B, C
+    for region in work.answer_regions:
+        # Extract text from region
+        text = _region_text(chars, tops, region.bbox)
+
+        if text:
+            # Clean up text (remove extra whitespace, newlines)
+            text = _WS_RE.sub(' ', text).strip()
+
+        extracted_answers.append(ExtractedAnswer(
+            question_number=region.anchor.number,
+            page=region.anchor.page,
+            answer_letter=region.answer_letter,
+            text=text or "",
+            region=region
+        ))
+
+    # Correct answers
+    if work.correct_answer_x is None:
+        return extracted_questions, extracted_answers, correct_answers, messages
+
+    # Y coordinates: from each anchor to the next anchor (or page bottom)
+    y_ends = _y_ends(work.anchors, page_height)
+
+    for i, (anchor, y_end) in enumerate(zip(work.anchors, y_ends)):
+        y_start = anchor.y
+
+        # X coordinates: Richtige Antwort column (with some width)
+        x_start = work.correct_answer_x
+        x_end = min(x_start + 50, page_width)  # Give some width to capture the letter
+
+        # Define bounding box
+        bbox = (x_start, y_start, x_end, y_end)
+
+        # Extract text from region
+        text = _region_text(chars, tops, bbox)
+
+        if text:
+            text = text.strip()
+            # Debug output
+            if i < 5:  # Show first 5
+                messages.append(f"  Question {anchor.number}: extracted '{text}' from bbox {bbox}")
+
+            # Look for A, B, or C in the text
+            letter = next((c for c in 'ABC' if c in text), None)
+            if letter:
+                correct_answers[anchor.number] = letter
+        else:
+            if i < 5:
+                messages.append(f"  Question {anchor.number}: NO TEXT extracted from bbox {bbox}")
+
+    return extracted_questions, extracted_answers, correct_answers, messages
+
+
+def _flush_page(page: pdfplumber.page.Page) -> None:
+    """Drop a page's cached objects (chars, images, text map) after processing.
+
+    pdfplumber keeps everything it parsed on the Page object, so without this
+    every page of the document stays in memory until the PDF is closed.
+    """
+    page.flush_cache()
+    page.get_textmap.cache_clear()
+
+
+# PDF opened once per worker process by _init_worker
+_worker_pdf = None
+
+
+def _init_worker(pdf_path: str) -> None:
+    """Open the PDF in a worker process of the extraction pool."""
+    global _worker_pdf
+    _worker_pdf = pdfplumber.open(pdf_path)
+
+
+def _extract_page_in_worker(
+    work: PageWork
+) -> Tuple[List[ExtractedQuestion], List[ExtractedAnswer], Dict[str, str], List[str]]:
+    """Run _extract_page in a worker process on its own copy of the PDF."""
+    page = _worker_pdf.pages[work.page_num - 1]
+    result = _extract_page(page, work)
+    _flush_page(page)
+    return result
+
+
 def match_images_to_questions(questions: List[QuestionOutput], images: List[ImageOutput], images_dir: Path) -> Dict[str, str]:
     """Match images to questions based on coordinates and rename files.
 
@@ -134,24 +360,11 @@ def match_images_to_questions(questions: List[QuestionOutput], images: List[Imag
     picture_questions = [q for q in questions if q.number.startswith('B')]
 
     # Group by page for efficiency
-    questions_by_page = {}
-    images_by_page = {}
-
-    for question in picture_questions:
-        page = question.page
-        if page not in questions_by_page:
-            questions_by_page[page] = []
-        questions_by_page[page].append(question)
-
-    for image in images:
-        page = image.page
-        if page not in images_by_page:
-            images_by_page[page] = []
-        images_by_page[page].append(image)
+    questions_by_page = _group_by_page(picture_questions)
+    images_by_page = _group_by_page(images)
 
     # Process each page
-    for page_num in sorted(questions_by_page.keys()):
-        page_questions = questions_by_page[page_num]
+    for page_num, page_questions in sorted(questions_by_page.items()):
         page_images = images_by_page.get(page_num, [])
 
         if not page_images:
@@ -199,144 +412,166 @@ def match_images_to_questions(questions: List[QuestionOutput], images: List[Imag
 class FishingExamParserSimple:
     """Main parser class."""
 
-    def __init__(self, pdf_path: str):
+    def __init__(self, pdf_path: str, chunk_size: int = 100):
         self.pdf_path = Path(pdf_path)
         if not self.pdf_path.exists():
             raise FileNotFoundError(f"PDF file not found: {pdf_path}")
+        # Pages are released as soon as they are processed; after every
+        # chunk_size released pages the garbage collector is run as well
+        self.chunk_size = chunk_size
+        self._released_pages = 0
+        self._pdf = None
+
+    def __enter__(self) -> "FishingExamParserSimple":
+        """Open the PDF once; every extraction step reuses the parsed document."""
+        self._pdf = pdfplumber.open(self.pdf_path)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self._pdf is not None:
+            self._pdf.close()
+            self._pdf = None
+
+    @property
+    def pdf(self) -> pdfplumber.PDF:
+        """The opened PDF document (only available inside a ``with`` block)."""
+        if self._pdf is None:
+            raise RuntimeError("PDF is not open; use the parser as a context manager")
+        return self._pdf
+
+    def _release_page(self, page: pdfplumber.page.Page) -> None:
+        """Flush a processed page's caches, collecting garbage after every chunk."""
+        _flush_page(page)
+        self._released_pages += 1
+        if self._released_pages % self.chunk_size == 0:
+            gc.collect()
+
+    def scan_pages(
+        self,
+        max_pages: Optional[int] = None
+    ) -> Tuple[List[PageHeaders], List[QuestionAnchor]]:
+        """Find column headers and question number anchors in a single pass.
 
-    def find_column_headers(self, max_pages: Optional[int] = None) -> List[PageHeaders]:
-        """Find column headers (Frage, Antwort A, B, C) X-coordinates for each page."""
+        Each page's words are extracted once and used both for the column
+        headers (Frage, Antwort A, B, C, Richtige Antwort) and for the question
+        number anchors, which come in two formats:
+        - Regular questions: 1.001, 1.002, 2.001, etc.
+        - Picture questions: B2.1, B2.2, B3.1, etc.
+        """
         all_page_headers = []
+        all_anchors = []
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
-
-                click.echo(f"Scanning {pages_to_process} of {total_pages} pages for column headers...")
+            pages = self.pdf.pages
+            total_pages = len(pages)
+            pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
 
-                for page_num, page in enumerate(pdf.pages[:pages_to_process], 1):
-                    if page_num % 20 == 0:
-                        click.echo(f"Scanned {page_num} pages...")
+            click.echo(
+                f"Scanning {pages_to_process} of {total_pages} pages "
+                "for column headers and question numbers..."
+            )
 
-                    # Extract text to find multi-word headers
-                    text = page.extract_text()
-                    if not text:
-                        continue
+            for page_num, page in enumerate(pages[:pages_to_process], 1):
+                if page_num % 20 == 0:
+                    click.echo(f"Scanned {page_num} pages...")
+
+                # Extract all words with positions
+                words = page.extract_words(x_tolerance=3, y_tolerance=3)
+                if not words:
+                    self._release_page(page)
+                    continue
+
+                # Initialize page headers
+                page_headers = PageHeaders(page=page_num)
+
+                # Look for exact header strings by checking consecutive words,
+                # and for question numbers, in the same pass over the words.
+                # The stripped texts are computed once per page and shared by
+                # the header checks, the "Antwort" index and the anchor test.
+                texts = [word['text'].strip() for word in words]
+
+                # Index words by text so "Richtige" can find its "Antwort" directly
+                words_by_text = defaultdict(list)
+                for text, word in zip(texts, words):
+                    words_by_text[text].append(word)
+
+                headers_complete = False
+                for i, text in enumerate(texts):
+                    word = words[i]
+                    # Header checks stop once all five columns are known; the
+                    # remaining words are only checked for question numbers
+                    if not headers_complete:
+                        # Most words are not header words: one dict lookup
+                        # skips them instead of a chain of string compares
+                        action = _HEADER_ACTIONS.get(text)
+                        if action is not None:
+                            if action == 'frage':
+                                page_headers.frage_x = word['x0']
+                            elif action == 'richtige':
+                                # "Richtige Antwort" might be split over two lines, so
+                                # look for an "Antwort" with similar X position (within 10 pixels)
+                                x0 = word['x0']
+                                for other_word in words_by_text.get('Antwort', ()):
+                                    if abs(other_word['x0'] - x0) < 10:
+                                        page_headers.richtige_antwort_x = x0
+                                        break
+                            elif i + 1 < len(texts):
+                                # "Antwort A", "Antwort B", "Antwort C"
+                                field = _ANSWER_HEADER_FIELDS.get(texts[i + 1])
+                                if field is not None:
+                                    setattr(page_headers, field, word['x0'])
+
+                            headers_complete = (
+                                page_headers.frage_x is not None and
+                                page_headers.antwort_a_x is not None and
+                                page_headers.antwort_b_x is not None and
+                                page_headers.antwort_c_x is not None and
+                                page_headers.richtige_antwort_x is not None
+                            )
 
-                    # Extract all words with positions
-                    words = page.extract_words(x_tolerance=3, y_tolerance=3)
-
-                    # Initialize page headers
-                    page_headers = PageHeaders(page=page_num)
-
-                    # Look for exact header strings by checking consecutive words
-                    words_list = list(words)
-                    for i, word in enumerate(words_list):
-                        # Check for "Frage"
-                        if word['text'].strip() == 'Frage':
-                            page_headers.frage_x = word['x0']
-
-                        # Check for "Richtige" (first part of "Richtige Antwort")
-                        # They might be on separate lines but should have similar X coordinate
-                        if word['text'].strip() == 'Richtige':
-                            # Look for "Antwort" with similar X position (within 10 pixels)
-                            for other_word in words_list:
-                                if (other_word['text'].strip() == 'Antwort' and
-                                    abs(other_word['x0'] - word['x0']) < 10):
-                                    page_headers.richtige_antwort_x = word['x0']
-                                    break
-
-                        # Check for "Antwort A", "Antwort B", "Antwort C"
-                        if word['text'].strip() == 'Antwort' and i + 1 < len(words_list):
-                            next_word = words_list[i + 1]
-                            if next_word['text'].strip() == 'A':
-                                page_headers.antwort_a_x = word['x0']
-                            elif next_word['text'].strip() == 'B':
-                                page_headers.antwort_b_x = word['x0']
-                            elif next_word['text'].strip() == 'C':
-                                page_headers.antwort_c_x = word['x0']
-
-                    # Only add if we found at least one header
-                    if page_headers.frage_x or page_headers.antwort_a_x:
-                        all_page_headers.append(page_headers)
-
-                click.echo(f"Found column headers on {len(all_page_headers)} pages")
+                    # Check for a question number
+                    if _is_anchor(text):
+                        all_anchors.append(QuestionAnchor(
+                            number=text,
+                            page=page_num,
+                            x=word['x0'],
+                            y=word['top'],
+                            x0=word['x0'],
+                            y0=word['top'],
+                            x1=word['x1'],
+                            y1=word['bottom']
+                        ))
 
-        except Exception as e:
-            click.echo(f"Error scanning PDF: {e}", err=True)
-            raise
+                # Only add if we found at least one header
+                if page_headers.frage_x or page_headers.antwort_a_x:
+                    all_page_headers.append(page_headers)
 
-        return all_page_headers
+                self._release_page(page)
 
-    def find_question_anchors(self, max_pages: Optional[int] = None) -> List[QuestionAnchor]:
-        """Find all question number anchors in the PDF with their coordinates.
+            # Separate regular and picture questions for logging
+            regular_count = sum(1 for a in all_anchors if not a.number.startswith('B'))
+            picture_count = sum(1 for a in all_anchors if a.number.startswith('B'))
 
-        Supports two formats:
-        - Regular questions: 1.001, 1.002, 2.001, etc.
-        - Picture questions: B2.1, B2.2, B3.1, etc.
-        """
-        all_anchors = []
-        try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
-
-                click.echo(f"Scanning {pages_to_process} of {total_pages} pages for question numbers...")
-
-                for page_num, page in enumerate(pdf.pages[:pages_to_process], 1):
-                    if page_num % 20 == 0:
-                        click.echo(f"Scanned {page_num} pages...")
-
-                    # Extract all words with positions
-                    words = page.extract_words(x_tolerance=3, y_tolerance=3)
-
-                    # Pattern 1: Regular questions (e.g., "1.001", "1.002", "2.001")
-                    regular_pattern = re.compile(r'^(\d+\.\d{3})$')
-
-                    # Pattern 2: Picture questions (e.g., "B2.1", "B2.2", "B3.1")
-                    picture_pattern = re.compile(r'^(B\d+\.\d+)$')
-
-                    for word in words:
-                        text = word['text'].strip()
-
-                        # Try regular pattern first
-                        match = regular_pattern.match(text)
-                        if not match:
-                            # Try picture pattern
-                            match = picture_pattern.match(text)
-
-                        if match:
-                            all_anchors.append(QuestionAnchor(
-                                number=match.group(1),
-                                page=page_num,
-                                x=word['x0'],
-                                y=word['top'],
-                                x0=word['x0'],
-                                y0=word['top'],
-                                x1=word['x1'],
-                                y1=word['bottom']
-                            ))
-
-                # Separate regular and picture questions for logging
-                regular_count = sum(1 for a in all_anchors if not a.number.startswith('B'))
-                picture_count = sum(1 for a in all_anchors if a.number.startswith('B'))
-
-                click.echo(f"Found {len(all_anchors)} question numbers total:")
-                click.echo(f"  Regular questions: {regular_count}")
-                click.echo(f"  Picture questions: {picture_count}")
+            click.echo(f"Found column headers on {len(all_page_headers)} pages")
+            click.echo(f"Found {len(all_anchors)} question numbers total:")
+            click.echo(f"  Regular questions: {regular_count}")
+            click.echo(f"  Picture questions: {picture_count}")
 
         except Exception as e:
             click.echo(f"Error scanning PDF: {e}", err=True)
             raise
 
-        return all_anchors
+        return all_page_headers, all_anchors
 
     def create_question_regions(
         self,
-        anchors: List[QuestionAnchor],
+        anchors_by_page: Dict[int, List[QuestionAnchor]],
         page_headers: List[PageHeaders]
     ) -> List[QuestionRegion]:
-        """Combine anchors and headers to create bounding boxes for questions."""
+        """Combine anchors and headers to create bounding boxes for questions.
+
+        anchors_by_page is the output of _anchors_by_page: anchors grouped by
+        page and sorted by Y coordinate on each page.
+        """
         regions = []
 
         # Create a map of page -> headers
@@ -350,16 +585,7 @@ class FishingExamParserSimple:
                 # This could be Bild-Fragen headers - save as fallback
                 bild_fragen_headers = headers
 
-        # Group anchors by page
-        anchors_by_page = {}
-        for anchor in anchors:
-            if anchor.page not in anchors_by_page:
-                anchors_by_page[anchor.page] = []
-            anchors_by_page[anchor.page].append(anchor)
-
-        # Sort anchors on each page by Y coordinate
-        for page_num in anchors_by_page:
-            anchors_by_page[page_num].sort(key=lambda a: a.y)
+        pages = self.pdf.pages
 
         # Create regions for each question
         for page_num, page_anchors in anchors_by_page.items():
@@ -382,98 +608,35 @@ class FishingExamParserSimple:
                 click.echo(f"Warning: Missing Frage or Antwort A columns on page {page_num}, skipping")
                 continue
 
-            for i, anchor in enumerate(page_anchors):
-                # X coordinates: from Frage column to Antwort A column
-                x_start = headers.frage_x
-                x_end = headers.antwort_a_x
+            # X coordinates: from Frage column to Antwort A column
+            x_start = headers.frage_x
+            x_end = headers.antwort_a_x
 
-                # Y coordinates: from this anchor to next anchor (or page bottom)
-                y_start = anchor.y
-                if i + 1 < len(page_anchors):
-                    y_end = page_anchors[i + 1].y
-                else:
-                    # Last question on page - we'll need page height
-                    # For now, use a large value that will be adjusted later
-                    y_end = 999999  # Will be replaced with actual page height
+            # Y coordinates: from each anchor to the next anchor (or page bottom)
+            y_ends = _y_ends(page_anchors, pages[page_num - 1].height)
 
+            for anchor, y_end in zip(page_anchors, y_ends):
                 regions.append(QuestionRegion(
                     anchor=anchor,
                     x_start=x_start,
                     x_end=x_end,
-                    y_start=y_start,
-                    y_end=y_end
+                    y_start=anchor.y,
+                    y_end=y_end,
+                    bbox=(x_start, anchor.y, x_end, y_end)
                 ))
 
         click.echo(f"Created {len(regions)} question regions")
         return regions
 
-    def extract_questions(
-        self,
-        regions: List[QuestionRegion],
-        max_pages: Optional[int] = None
-    ) -> List[ExtractedQuestion]:
-        """Extract question text from defined regions."""
-        extracted_questions = []
-
-        try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
-
-                click.echo(f"Extracting text from {len(regions)} regions...")
-
-                # Group regions by page for efficiency
-                regions_by_page = {}
-                for region in regions:
-                    page_num = region.anchor.page
-                    if page_num not in regions_by_page:
-                        regions_by_page[page_num] = []
-                    regions_by_page[page_num].append(region)
-
-                # Process each page
-                for page_num in sorted(regions_by_page.keys()):
-                    if page_num > pages_to_process:
-                        break
-
-                    page = pdf.pages[page_num - 1]  # 0-indexed
-                    page_height = page.height
-
-                    for region in regions_by_page[page_num]:
-                        # Adjust y_end if it was set to placeholder
-                        y_end = region.y_end if region.y_end < 999999 else page_height
-
-                        # Define bounding box (x0, top, x1, bottom)
-                        bbox = (region.x_start, region.y_start, region.x_end, y_end)
-
-                        # Extract text from region
-                        cropped = page.within_bbox(bbox)
-                        text = cropped.extract_text()
-
-                        if text:
-                            # Clean up text (remove extra whitespace, newlines)
-                            text = ' '.join(text.split())
-
-                        extracted_questions.append(ExtractedQuestion(
-                            number=region.anchor.number,
-                            page=region.anchor.page,
-                            text=text or "",
-                            region=region
-                        ))
-
-                click.echo(f"Extracted {len(extracted_questions)} questions")
-
-        except Exception as e:
-            click.echo(f"Error extracting questions: {e}", err=True)
-            raise
-
-        return extracted_questions
-
     def create_answer_regions(
         self,
-        anchors: List[QuestionAnchor],
+        anchors_by_page: Dict[int, List[QuestionAnchor]],
         page_headers: List[PageHeaders]
     ) -> List[AnswerRegion]:
-        """Create bounding boxes for answer extraction (A, B, C)."""
+        """Create bounding boxes for answer extraction (A, B, C).
+
+        anchors_by_page is grouped and sorted as for create_question_regions.
+        """
         regions = []
 
         # Create a map of page -> headers
@@ -485,16 +648,7 @@ class FishingExamParserSimple:
             if headers.antwort_a_x and headers.antwort_b_x and headers.antwort_c_x:
                 bild_fragen_headers = headers
 
-        # Group anchors by page
-        anchors_by_page = {}
-        for anchor in anchors:
-            if anchor.page not in anchors_by_page:
-                anchors_by_page[anchor.page] = []
-            anchors_by_page[anchor.page].append(anchor)
-
-        # Sort anchors on each page by Y coordinate
-        for page_num in anchors_by_page:
-            anchors_by_page[page_num].sort(key=lambda a: a.y)
+        pages = self.pdf.pages
 
         # Create regions for each answer
         for page_num, page_anchors in anchors_by_page.items():
@@ -515,122 +669,41 @@ class FishingExamParserSimple:
                 click.echo(f"Warning: Missing answer columns on page {page_num}, skipping")
                 continue
 
-            for i, anchor in enumerate(page_anchors):
-                # Y coordinates: from this anchor to next anchor (or page bottom)
-                y_start = anchor.y
-                if i + 1 < len(page_anchors):
-                    y_end = page_anchors[i + 1].y
-                else:
-                    y_end = 999999  # Will be replaced with actual page height
+            page = pages[page_num - 1]
 
-                # Answer A: from antwort_a_x to antwort_b_x
-                regions.append(AnswerRegion(
-                    anchor=anchor,
-                    answer_letter='A',
-                    x_start=headers.antwort_a_x,
-                    x_end=headers.antwort_b_x,
-                    y_start=y_start,
-                    y_end=y_end
-                ))
+            # Y coordinates: from each anchor to the next anchor (or page bottom)
+            y_ends = _y_ends(page_anchors, page.height)
 
-                # Answer B: from antwort_b_x to antwort_c_x
-                regions.append(AnswerRegion(
-                    anchor=anchor,
-                    answer_letter='B',
-                    x_start=headers.antwort_b_x,
-                    x_end=headers.antwort_c_x,
-                    y_start=y_start,
-                    y_end=y_end
-                ))
+            # X coordinates per answer: A up to B, B up to C, C up to the page edge
+            columns = (
+                ('A', headers.antwort_a_x, headers.antwort_b_x),
+                ('B', headers.antwort_b_x, headers.antwort_c_x),
+                ('C', headers.antwort_c_x, page.width),
+            )
 
-                # Answer C: from antwort_c_x to end (page width)
-                # We'll need to get page width when extracting
-                regions.append(AnswerRegion(
-                    anchor=anchor,
-                    answer_letter='C',
-                    x_start=headers.antwort_c_x,
-                    x_end=999999,  # Will be replaced with actual page width
-                    y_start=y_start,
-                    y_end=y_end
-                ))
+            for anchor, y_end in zip(page_anchors, y_ends):
+                y_start = anchor.y
+                for letter, x_start, x_end in columns:
+                    regions.append(AnswerRegion(
+                        anchor=anchor,
+                        answer_letter=letter,
+                        x_start=x_start,
+                        x_end=x_end,
+                        y_start=y_start,
+                        y_end=y_end,
+                        bbox=(x_start, y_start, x_end, y_end)
+                    ))
 
         click.echo(f"Created {len(regions)} answer regions")
         return regions
 
-    def extract_answers(
+    def find_correct_answer_columns(
         self,
-        regions: List[AnswerRegion],
-        max_pages: Optional[int] = None
-    ) -> List[ExtractedAnswer]:
-        """Extract answer text from defined regions."""
-        extracted_answers = []
-
-        try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
-
-                click.echo(f"Extracting text from {len(regions)} answer regions...")
-
-                # Group regions by page for efficiency
-                regions_by_page = {}
-                for region in regions:
-                    page_num = region.anchor.page
-                    if page_num not in regions_by_page:
-                        regions_by_page[page_num] = []
-                    regions_by_page[page_num].append(region)
-
-                # Process each page
-                for page_num in sorted(regions_by_page.keys()):
-                    if page_num > pages_to_process:
-                        break
-
-                    page = pdf.pages[page_num - 1]  # 0-indexed
-                    page_height = page.height
-                    page_width = page.width
-
-                    for region in regions_by_page[page_num]:
-                        # Adjust y_end if it was set to placeholder
-                        y_end = region.y_end if region.y_end < 999999 else page_height
-
-                        # Adjust x_end if it was set to placeholder (Answer C)
-                        x_end = region.x_end if region.x_end < 999999 else page_width
-
-                        # Define bounding box (x0, top, x1, bottom)
-                        bbox = (region.x_start, region.y_start, x_end, y_end)
-
-                        # Extract text from region
-                        cropped = page.within_bbox(bbox)
-                        text = cropped.extract_text()
-
-                        if text:
-                            # Clean up text (remove extra whitespace, newlines)
-                            text = ' '.join(text.split())
-
-                        extracted_answers.append(ExtractedAnswer(
-                            question_number=region.anchor.number,
-                            page=region.anchor.page,
-                            answer_letter=region.answer_letter,
-                            text=text or "",
-                            region=region
-                        ))
-
-                click.echo(f"Extracted {len(extracted_answers)} answers")
-
-        except Exception as e:
-            click.echo(f"Error extracting answers: {e}", err=True)
-            raise
-
-        return extracted_answers
-
-    def extract_correct_answers(
-        self,
-        anchors: List[QuestionAnchor],
-        page_headers: List[PageHeaders],
-        max_pages: Optional[int] = None
-    ) -> Dict[str, str]:
-        """Extract which answer (A, B, or C) is correct for each question."""
-        correct_answers = {}
+        anchors_by_page: Dict[int, List[QuestionAnchor]],
+        page_headers: List[PageHeaders]
+    ) -> Dict[int, float]:
+        """Map each page with questions to the X-coordinate of its 'Richtige Antwort' column."""
+        columns = {}
 
         # Create a map of page -> headers
         headers_by_page = {h.page: h for h in page_headers}
@@ -641,93 +714,132 @@ class FishingExamParserSimple:
             if headers.richtige_antwort_x:
                 bild_fragen_headers = headers
 
-        # Group anchors by page
-        anchors_by_page = {}
-        for anchor in anchors:
-            if anchor.page not in anchors_by_page:
-                anchors_by_page[anchor.page] = []
-            anchors_by_page[anchor.page].append(anchor)
+        for page_num, page_anchors in anchors_by_page.items():
+            # Check if this is a Bild-Fragen page
+            is_bild_page = any(a.number.startswith('B') for a in page_anchors)
 
-        # Sort anchors on each page by Y coordinate
-        for page_num in anchors_by_page:
-            anchors_by_page[page_num].sort(key=lambda a: a.y)
+            # Get headers for this page
+            if page_num in headers_by_page:
+                headers = headers_by_page[page_num]
+            elif is_bild_page and bild_fragen_headers:
+                headers = bild_fragen_headers
+            else:
+                click.echo(f"Warning: No headers for page {page_num}, skipping correct answers")
+                continue
+
+            if headers.richtige_antwort_x is None:
+                click.echo(f"Warning: No 'Richtige Antwort' column on page {page_num}, skipping")
+                continue
+
+            columns[page_num] = headers.richtige_antwort_x
+
+        return columns
+
+    def extract_all(
+        self,
+        anchors: List[QuestionAnchor],
+        page_headers: List[PageHeaders],
+        max_pages: Optional[int] = None,
+        workers: Optional[int] = None
+    ) -> Tuple[List[ExtractedQuestion], List[ExtractedAnswer], Dict[str, str]]:
+        """Extract question text, answers (A, B, C) and correct answers in one pass.
+
+        Each page is visited once and all regions belonging to its anchors
+        (question, three answers and the correct-answer column) are read from
+        the same char list. Pages are independent, so they are spread over
+        ``workers`` processes (default: one per CPU); ``workers=1`` extracts
+        in this process.
+        """
+        extracted_questions = []
+        extracted_answers = []
+        correct_answers = {}
+
+        # Group anchors by page, sorted by Y coordinate on each page; the
+        # grouping is computed once and shared by every step below
+        anchors_by_page = _anchors_by_page(anchors)
+
+        # Bounding boxes for every question and answer, grouped by page
+        question_regions = self.create_question_regions(anchors_by_page, page_headers)
+        answer_regions = self.create_answer_regions(anchors_by_page, page_headers)
+        question_regions_by_page = _group_by_page(
+            question_regions, page_of=attrgetter('anchor.page')
+        )
+        answer_regions_by_page = _group_by_page(answer_regions, page_of=attrgetter('anchor.page'))
+        correct_answer_columns = self.find_correct_answer_columns(anchors_by_page, page_headers)
 
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
-
-                click.echo(f"Extracting correct answers for {len(anchors)} questions...")
-
-                # Process each page
-                for page_num in sorted(anchors_by_page.keys()):
-                    if page_num > pages_to_process:
-                        break
-
-                    # Check if this is a Bild-Fragen page
-                    page_anchors = anchors_by_page[page_num]
-                    is_bild_page = any(a.number.startswith('B') for a in page_anchors)
-
-                    # Get headers for this page
-                    if page_num in headers_by_page:
-                        headers = headers_by_page[page_num]
-                    elif is_bild_page and bild_fragen_headers:
-                        headers = bild_fragen_headers
-                    else:
-                        click.echo(f"Warning: No headers for page {page_num}, skipping correct answers")
-                        continue
+            pages = self.pdf.pages
+            total_pages = len(pages)
+            pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
+
+            # One work item per page
+            work_items = []
+            for page_num, page_anchors in sorted(anchors_by_page.items()):
+                if page_num > pages_to_process:
+                    break
+
+                work_items.append(PageWork(
+                    page_num=page_num,
+                    question_regions=question_regions_by_page.get(page_num, []),
+                    answer_regions=answer_regions_by_page.get(page_num, []),
+                    anchors=page_anchors,
+                    correct_answer_x=correct_answer_columns.get(page_num)
+                ))
 
-                    if headers.richtige_antwort_x is None:
-                        click.echo(f"Warning: No 'Richtige Antwort' column on page {page_num}, skipping")
-                        continue
+            workers = workers or os.cpu_count() or 1
+            workers = min(workers, len(work_items)) or 1
 
-                    page = pdf.pages[page_num - 1]  # 0-indexed
-                    page_height = page.height
-                    page_width = page.width
-
-                    for i, anchor in enumerate(page_anchors):
-                        # Y coordinates: from this anchor to next anchor
-                        y_start = anchor.y
-                        if i + 1 < len(page_anchors):
-                            y_end = page_anchors[i + 1].y
-                        else:
-                            y_end = page_height
-
-                        # X coordinates: Richtige Antwort column (with some width)
-                        x_start = headers.richtige_antwort_x
-                        x_end = min(x_start + 50, page_width)  # Give some width to capture the letter
-
-                        # Define bounding box
-                        bbox = (x_start, y_start, x_end, y_end)
-
-                        # Extract text from region
-                        cropped = page.within_bbox(bbox)
-                        text = cropped.extract_text()
-
-                        if text:
-                            text = text.strip()
-                            # Debug output
-                            if i < 5:  # Show first 5
-                                click.echo(f"  Question {anchor.number}: extracted '{text}' from bbox {bbox}")
-
-                            # Look for A, B, or C in the text
-                            if 'A' in text:
-                                correct_answers[anchor.number] = 'A'
-                            elif 'B' in text:
-                                correct_answers[anchor.number] = 'B'
-                            elif 'C' in text:
-                                correct_answers[anchor.number] = 'C'
-                        else:
-                            if i < 5:
-                                click.echo(f"  Question {anchor.number}: NO TEXT extracted from bbox {bbox}")
-
-                click.echo(f"Found {len(correct_answers)} correct answers")
+            click.echo(
+                f"Extracting text from {len(question_regions)} question regions, "
+                f"{len(answer_regions)} answer regions and correct answers "
+                f"for {len(anchors)} questions ({workers} worker(s))..."
+            )
+
+            if workers == 1:
+                results = []
+                for work in work_items:
+                    page = pages[work.page_num - 1]
+                    results.append(_extract_page(page, work))
+                    self._release_page(page)
+                self._collect_page_results(
+                    results, extracted_questions, extracted_answers, correct_answers
+                )
+            else:
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    initializer=_init_worker,
+                    initargs=(str(self.pdf_path),)
+                ) as executor:
+                    # map() yields results in page order
+                    results = executor.map(_extract_page_in_worker, work_items)
+                    self._collect_page_results(
+                        results, extracted_questions, extracted_answers, correct_answers
+                    )
+
+            click.echo(f"Extracted {len(extracted_questions)} questions")
+            click.echo(f"Extracted {len(extracted_answers)} answers")
+            click.echo(f"Found {len(correct_answers)} correct answers")
 
         except Exception as e:
-            click.echo(f"Error extracting correct answers: {e}", err=True)
+            click.echo(f"Error extracting text: {e}", err=True)
             raise
 
-        return correct_answers
+        return extracted_questions, extracted_answers, correct_answers
+
+    @staticmethod
+    def _collect_page_results(
+        results,
+        extracted_questions: List[ExtractedQuestion],
+        extracted_answers: List[ExtractedAnswer],
+        correct_answers: Dict[str, str]
+    ) -> None:
+        """Merge per-page extraction results (in page order) into the totals."""
+        for page_questions, page_answers, page_correct, messages in results:
+            for message in messages:
+                click.echo(message)
+            extracted_questions.extend(page_questions)
+            extracted_answers.extend(page_answers)
+            correct_answers.update(page_correct)
 
     def extract_images_for_picture_questions(
         self,
@@ -751,107 +863,90 @@ class FishingExamParserSimple:
         # Create output directory
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Group by page
-        questions_by_page = {}
-        for anchor in picture_questions:
-            if anchor.page not in questions_by_page:
-                questions_by_page[anchor.page] = []
-            questions_by_page[anchor.page].append(anchor)
-
-        # Sort by Y position on each page
-        for page_num in questions_by_page:
-            questions_by_page[page_num].sort(key=lambda a: a.y)
+        # Group by page, sorted by Y position on each page
+        questions_by_page = _anchors_by_page(picture_questions)
 
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
-
-                click.echo(f"Extracting images for {len(picture_questions)} picture questions...")
-
-                for page_num in sorted(questions_by_page.keys()):
-                    if page_num > pages_to_process:
-                        break
-
-                    page = pdf.pages[page_num - 1]
-                    page_questions = questions_by_page[page_num]
-                    page_height = page.height  # Get page height for coordinate conversion
-
-                    # Get all images on this page
-                    images = page.images
-
-                    if len(images) < len(page_questions):
-                        click.echo(f"Warning: Page {page_num} has {len(images)} images but {len(page_questions)} questions")
-
-                    # Process all images on this page, creating unique IDs
-                    for img_idx, img_data in enumerate(images):
-                        # Create unique image ID
-                        image_id = f"page_{page_num}_img_{img_idx}"
-
-                        # Get image format from stream
-                        image_stream = img_data.get('stream')
-                        if not image_stream:
-                            click.echo(f"Warning: No stream for image {img_idx} on page {page_num}")
-                            continue
-
-                        # Determine file extension
-                        # Try to get format from Filter
-                        img_filter = image_stream.get('Filter', '')
-                        if isinstance(img_filter, list):
-                            img_filter = img_filter[0] if img_filter else ''
-
-                        # Map PDF filter to file extension
-                        extension = 'png'  # default
-                        if 'DCT' in str(img_filter) or 'JPEG' in str(img_filter):
-                            extension = 'jpg'
-                        elif 'JPX' in str(img_filter):
-                            extension = 'jp2'
-
-                        # Save image with unique filename
-                        filename = f"{image_id}.{extension}"
-                        filepath = output_dir / filename
-
-                        try:
-                            # Extract image data
-                            img_bytes = image_stream.get_data()
-
-                            # Save to file
-                            with open(filepath, 'wb') as f:
-                                f.write(img_bytes)
-
-                            # Convert coordinates from bottom-based (PDFplumber) to top-based
-                            img_x0 = img_data.get('x0', 0)
-                            img_y0_bottom = img_data.get('y0', 0)  # Bottom of image in PDFplumber coords
-                            img_x1 = img_data.get('x1', 0)
-                            img_y1_bottom = img_data.get('y1', 0)  # Top of image in PDFplumber coords
-                            img_width = img_data.get('width', 0)
-                            img_height = img_data.get('height', 0)
-
-                            # Convert to top-based coordinates: top_y = page_height - bottom_y
-                            img_y0_top = page_height - img_y1_bottom  # Top of image in top-based coords
-                            img_y1_top = page_height - img_y0_bottom  # Bottom of image in top-based coords
-
-                            # Create ImageOutput object
-                            image_output = ImageOutput(
-                                image_id=image_id,
-                                filename=filename,
-                                page=page_num,
-                                coords={
-                                    'x0': img_x0,
-                                    'y0': img_y0_top,  # Top of image (top-based)
-                                    'x1': img_x1,
-                                    'y1': img_y1_top,  # Bottom of image (top-based)
-                                    'width': img_width,
-                                    'height': img_height
-                                }
-                            )
-                            image_outputs.append(image_output)
-                            click.echo(f"  Saved {filename} (ID: {image_id}) at ({img_x0:.1f}, {img_y0_top:.1f}) [top-based]")
+            pages = self.pdf.pages
+            total_pages = len(pages)
+            pages_to_process = min(max_pages, total_pages) if max_pages else total_pages
+
+            click.echo(f"Extracting images for {len(picture_questions)} picture questions...")
+
+            for page_num, page_questions in sorted(questions_by_page.items()):
+                if page_num > pages_to_process:
+                    break
+
+                page = pages[page_num - 1]
+                page_height = page.height  # Get page height for coordinate conversion
+
+                # Get all images on this page
+                images = page.images
 
-                        except Exception as e:
-                            click.echo(f"  Error saving image {image_id}: {e}")
+                if len(images) < len(page_questions):
+                    click.echo(f"Warning: Page {page_num} has {len(images)} images but {len(page_questions)} questions")
 
-                click.echo(f"Extracted {len(image_outputs)} images to {output_dir}")
+                # Process all images on this page, creating unique IDs
+                for img_idx, img_data in enumerate(images):
+                    # Create unique image ID
+                    image_id = f"page_{page_num}_img_{img_idx}"
+
+                    # Get image format from stream
+                    image_stream = img_data.get('stream')
+                    if not image_stream:
+                        click.echo(f"Warning: No stream for image {img_idx} on page {page_num}")
+                        continue
+
+                    # Determine file extension from the stream's Filter
+                    extension = _image_extension(image_stream.get('Filter', ''))
+
+                    # Save image with unique filename
+                    filename = f"{image_id}.{extension}"
+                    filepath = output_dir / filename
+
+                    try:
+                        # Extract image data
+                        img_bytes = image_stream.get_data()
+
+                        # Save to file
+                        with open(filepath, 'wb') as f:
+                            f.write(img_bytes)
+
+                        # Convert coordinates from bottom-based (PDFplumber) to top-based
+                        img_x0 = img_data.get('x0', 0)
+                        img_y0_bottom = img_data.get('y0', 0)  # Bottom of image in PDFplumber coords
+                        img_x1 = img_data.get('x1', 0)
+                        img_y1_bottom = img_data.get('y1', 0)  # Top of image in PDFplumber coords
+                        img_width = img_data.get('width', 0)
+                        img_height = img_data.get('height', 0)
+
+                        # Convert to top-based coordinates: top_y = page_height - bottom_y
+                        img_y0_top = page_height - img_y1_bottom  # Top of image in top-based coords
+                        img_y1_top = page_height - img_y0_bottom  # Bottom of image in top-based coords
+
+                        # Create ImageOutput object
+                        image_output = ImageOutput(
+                            image_id=image_id,
+                            filename=filename,
+                            page=page_num,
+                            coords={
+                                'x0': img_x0,
+                                'y0': img_y0_top,  # Top of image (top-based)
+                                'x1': img_x1,
+                                'y1': img_y1_top,  # Bottom of image (top-based)
+                                'width': img_width,
+                                'height': img_height
+                            }
+                        )
+                        image_outputs.append(image_output)
+                        click.echo(f"  Saved {filename} (ID: {image_id}) at ({img_x0:.1f}, {img_y0_top:.1f}) [top-based]")
+
+                    except Exception as e:
+                        click.echo(f"  Error saving image {image_id}: {e}")
+
+                self._release_page(page)
+
+            click.echo(f"Extracted {len(image_outputs)} images to {output_dir}")
 
         except Exception as e:
             click.echo(f"Error extracting images: {e}", err=True)
@@ -880,87 +975,84 @@ class FishingExamParserSimple:
     type=int,
     help='Limit parsing to first N pages (useful for testing)'
 )
+@click.option(
+    '--workers', '-w',
+    type=click.IntRange(min=1),
+    help='Number of processes for text extraction (default: one per CPU)'
+)
 @click.option(
     '--debug',
     is_flag=True,
     help='Enable debug output with raw lines'
 )
-def main(input_file: str, output: str, pages: Optional[int], debug: bool) -> None:
+def main(
+    input_file: str,
+    output: str,
+    pages: Optional[int],
+    workers: Optional[int],
+    debug: bool
+) -> None:
     """Parse Bavarian fishing exam questions using FSM approach."""
     try:
-        parser = FishingExamParserSimple(input_file)
-
-        # Step 1: Find column headers
-        click.echo("\n=== Step 1: Finding column headers ===")
-        column_headers = parser.find_column_headers(max_pages=pages)
-
-        if debug or True:
-            print("\n=== Column Headers ===")
-            for headers in column_headers[:5]:  # Show first 5 pages
-                print(f"\nPage {headers.page}:")
-                print(f"  Frage: {headers.frage_x}")
-                print(f"  Antwort A: {headers.antwort_a_x}")
-                print(f"  Antwort B: {headers.antwort_b_x}")
-                print(f"  Antwort C: {headers.antwort_c_x}")
-                print(f"  Richtige Antwort: {headers.richtige_antwort_x}")
-
-        # Step 2: Find all question number anchors
-        click.echo("\n=== Step 2: Finding question numbers ===")
-        anchors = parser.find_question_anchors(max_pages=pages)
-
-        if debug or True:
-            print("\n=== Question Anchors ===")
-            for anchor in anchors[:10]:  # Show first 10
-                print(f"Question {anchor.number}: page {anchor.page}, x={anchor.x:.1f}, y={anchor.y:.1f}")
-
-        # Step 3: Create question regions by combining headers and anchors
-        click.echo("\n=== Step 3: Creating question regions ===")
-        regions = parser.create_question_regions(anchors, column_headers)
-
-        if debug or True:
-            print("\n=== Question Regions ===")
-            for region in regions[:5]:  # Show first 5
-                print(f"Question {region.anchor.number} (page {region.anchor.page}):")
-                print(f"  X: {region.x_start:.1f} -> {region.x_end:.1f}")
-                print(f"  Y: {region.y_start:.1f} -> {region.y_end:.1f}")
-
-        # Step 4: Extract question text from regions
-        click.echo("\n=== Step 4: Extracting question text ===")
-        questions = parser.extract_questions(regions, max_pages=pages)
-
-        if debug or True:
-            print("\n=== Extracted Questions ===")
-            for question in questions[:5]:  # Show first 5
-                print(f"\nQuestion {question.number} (page {question.page}):")
-                print(f"  Text: {question.text[:100]}..." if len(question.text) > 100 else f"  Text: {question.text}")
-
-        # Step 5: Create answer regions
-        click.echo("\n=== Step 5: Creating answer regions ===")
-        answer_regions = parser.create_answer_regions(anchors, column_headers)
-
-        # Step 6: Extract answers
-        click.echo("\n=== Step 6: Extracting answers ===")
-        answers = parser.extract_answers(answer_regions, max_pages=pages)
-
-        # Step 7: Extract correct answers
-        click.echo("\n=== Step 7: Extracting correct answers ===")
-        correct_answers = parser.extract_correct_answers(anchors, column_headers, max_pages=pages)
-
-        # Step 8: Extract images for picture questions
-        click.echo("\n=== Step 8: Extracting images for picture questions ===")
-        images_dir = Path(output).parent / "images"
-        image_outputs = parser.extract_images_for_picture_questions(anchors, images_dir, max_pages=pages)
-
-        if debug or True:
-            print("\n=== Extracted Questions with Answers ===")
-            # Group answers by question
+        with FishingExamParserSimple(input_file) as parser:
+            # Steps 1-2: Find column headers and question number anchors
+            click.echo("\n=== Steps 1-2: Finding column headers and question numbers ===")
+            column_headers, anchors = parser.scan_pages(max_pages=pages)
+
+            if debug:
+                click.echo("\n=== Column Headers ===")
+                for headers in column_headers[:5]:  # Show first 5 pages
+                    click.echo(f"\nPage {headers.page}:")
+                    click.echo(f"  Frage: {headers.frage_x}")
+                    click.echo(f"  Antwort A: {headers.antwort_a_x}")
+                    click.echo(f"  Antwort B: {headers.antwort_b_x}")
+                    click.echo(f"  Antwort C: {headers.antwort_c_x}")
+                    click.echo(f"  Richtige Antwort: {headers.richtige_antwort_x}")
+
+            if debug:
+                click.echo("\n=== Question Anchors ===")
+                for anchor in anchors[:10]:  # Show first 10
+                    click.echo(f"Question {anchor.number}: page {anchor.page}, x={anchor.x:.1f}, y={anchor.y:.1f}")
+
+            # Steps 3-7: Create regions and extract questions, answers and correct answers
+            click.echo("\n=== Steps 3-7: Extracting questions, answers and correct answers ===")
+            questions, answers, correct_answers = parser.extract_all(
+                anchors, column_headers, max_pages=pages, workers=workers
+            )
+
+            if debug:
+                click.echo("\n=== Question Regions ===")
+                for question in questions[:5]:  # Show first 5
+                    region = question.region
+                    click.echo(f"Question {region.anchor.number} (page {region.anchor.page}):")
+                    click.echo(f"  X: {region.x_start:.1f} -> {region.x_end:.1f}")
+                    click.echo(f"  Y: {region.y_start:.1f} -> {region.y_end:.1f}")
+
+            if debug:
+                click.echo("\n=== Extracted Questions ===")
+                for question in questions[:5]:  # Show first 5
+                    click.echo(f"\nQuestion {question.number} (page {question.page}):")
+                    click.echo(f"  Text: {question.text[:100]}..." if len(question.text) > 100 else f"  Text: {question.text}")
+
+            # Step 8: Extract images for picture questions
+            click.echo("\n=== Step 8: Extracting images for picture questions ===")
+            images_dir = Path(output).parent / "images"
+            image_outputs = parser.extract_images_for_picture_questions(anchors, images_dir, max_pages=pages)
+
+        # Group answers by question once: question number -> {letter: text}
+        answers_by_q = defaultdict(dict)
+        for ans in answers:
+            answers_by_q[ans.question_number][ans.answer_letter] = ans.text
+
+        if debug:
+            click.echo("\n=== Extracted Questions with Answers ===")
             for question in questions[:3]:  # Show first 3 questions
                 correct = correct_answers.get(question.number, '?')
-                print(f"\nQuestion {question.number} (Correct: {correct}):")
-                print(f"  Q: {question.text[:80]}..." if len(question.text) > 80 else f"  Q: {question.text}")
-                for ans in [a for a in answers if a.question_number == question.number]:
-                    marker = " ✓" if ans.answer_letter == correct else ""
-                    print(f"  {ans.answer_letter}{marker}: {ans.text[:60]}..." if len(ans.text) > 60 else f"  {ans.answer_letter}{marker}: {ans.text}")
+                click.echo(f"\nQuestion {question.number} (Correct: {correct}):")
+                click.echo(f"  Q: {question.text[:80]}..." if len(question.text) > 80 else f"  Q: {question.text}")
+                for letter, text in answers_by_q.get(question.number, {}).items():
+                    marker = " ✓" if letter == correct else ""
+                    click.echo(f"  {letter}{marker}: {text[:60]}..." if len(text) > 60 else f"  {letter}{marker}: {text}")
 
         # Step 9: Match images to questions and rename files
         click.echo(f"\n=== Step 9: Matching images to questions ===")
@@ -970,12 +1062,7 @@ def main(input_file: str, output: str, pages: Optional[int], debug: bool) -> Non
 
         for question in questions:
             # Get answers for this question
-            question_answers = [a for a in answers if a.question_number == question.number]
-
-            # Build answer dict
-            answers_dict = {}
-            for ans in question_answers:
-                answers_dict[ans.answer_letter] = ans.text
+            answers_dict = answers_by_q.get(question.number, {})
 
             # Get correct answer
             correct = correct_answers.get(question.number)
@@ -1004,6 +1091,12 @@ def main(input_file: str, output: str, pages: Optional[int], debug: bool) -> Non
             )
             output_data.append(question_output)
 
+        # The output models now hold everything that gets written; drop the
+        # extraction results (regions, per-letter answers) so they are not kept
+        # alive next to the serialized JSON
+        question_count, answer_count = len(questions), len(answers)
+        del questions, answers, answers_by_q
+
         # Match images to questions and rename files
         if image_outputs:
             image_assignments = match_images_to_questions(output_data, image_outputs, images_dir)
@@ -1019,15 +1112,16 @@ def main(input_file: str, output: str, pages: Optional[int], debug: bool) -> Non
             images=image_outputs
         )
 
-        # Write to JSON file using Pydantic
+        # Write to JSON file using Pydantic: the whole model tree is serialized
+        # to UTF-8 bytes in one pydantic-core call, without an intermediate
+        # dict copy or a str that has to be encoded again
         output_path = Path(output)
-        with output_path.open('w', encoding='utf-8') as f:
-            json.dump(exam_output.model_dump(), f, indent=2, ensure_ascii=False)
+        output_path.write_bytes(_EXAM_OUTPUT_ADAPTER.dump_json(exam_output, indent=2))
 
         click.echo(f"Successfully wrote {len(output_data)} questions and {len(image_outputs)} images to {output}")
         click.echo(f"\nSummary:")
-        click.echo(f"  Total questions: {len(questions)}")
-        click.echo(f"  Total answers: {len(answers)}")
+        click.echo(f"  Total questions: {question_count}")
+        click.echo(f"  Total answers: {answer_count}")
         click.echo(f"  Correct answers found: {len(correct_answers)}")
         click.echo(f"  Picture question images: {len(image_outputs)}")
         if image_outputs:
@@ -17,9 +17,9 @@ Usage:
     uv run generate_anki_deck.py --input fishing_exam_fsm.json --output fishing_exam.apkg
 """
 
-import json
-import random
+import html
 import sys
+from collections import defaultdict
 from pathlib import Path
 from typing import List, Optional
 
@@ -38,11 +38,17 @@ class Question(BaseModel):
     image: Optional[str] = None
 
 
+class ExamInput(BaseModel):
+    """Top-level structure of the parser output (images are not needed here)."""
+    questions: List[Question]
+
+
 class AnkiDeckGenerator:
     """Generate Anki deck from fishing exam questions."""
 
-    # Custom model ID (random but stable)
-    MODEL_ID = 1607392319
+    # Custom model ID (random but stable); changed when the fields changed
+    # to the pre-rendered AnswersFront/AnswersHTML fields
+    MODEL_ID = 1607392320
 
     # Base deck ID (random but stable)
     BASE_DECK_ID = 2059400110
@@ -57,6 +63,21 @@ class AnkiDeckGenerator:
         'B': 'Bilder'
     }
 
+    # Subdeck IDs per topic. Anki identifies decks by ID, so these must stay
+    # the same across runs (hash() of a str is randomized per interpreter)
+    DECK_IDS = {
+        'Fischkunde': BASE_DECK_ID + 1,
+        'Gewässerkunde': BASE_DECK_ID + 2,
+        'Schutz und Pflege der Fischgewässer': BASE_DECK_ID + 3,
+        'Fanggeräte': BASE_DECK_ID + 4,
+        'Rechtsvorschriften': BASE_DECK_ID + 5,
+        'Bilder': BASE_DECK_ID + 6,
+        'Unknown': BASE_DECK_ID + 99,
+    }
+    # Every topic (including the Unknown fallback) needs a deck ID
+    assert set(TOPIC_MAPPING.values()) | {'Unknown'} == set(DECK_IDS), \
+        "DECK_IDS must have an entry for every TOPIC_MAPPING topic and 'Unknown'"
+
     def __init__(self, deck_name: str = "Bayerische Fischerprüfung 2025"):
         self.deck_name = deck_name
         self.decks = {}  # Will store topic -> deck mapping
@@ -69,13 +90,9 @@ class AnkiDeckGenerator:
                 {'name': 'QuestionNumber'},
                 {'name': 'Question'},
                 {'name': 'Image'},
-                {'name': 'AnswerA'},
-                {'name': 'AnswerB'},
-                {'name': 'AnswerC'},
+                {'name': 'AnswersFront'},
+                {'name': 'AnswersHTML'},
                 {'name': 'CorrectAnswer'},
-                {'name': 'IsACorrect'},
-                {'name': 'IsBCorrect'},
-                {'name': 'IsCCorrect'},
                 {'name': 'Explanation'},
             ],
             templates=[
@@ -90,11 +107,7 @@ class AnkiDeckGenerator:
                         </div>
                         {{/Image}}
                         <hr>
-                        <div class="answers">
-                            <div class="answer">A) {{AnswerA}}</div>
-                            <div class="answer">B) {{AnswerB}}</div>
-                            <div class="answer">C) {{AnswerC}}</div>
-                        </div>
+                        <div class="answers">{{AnswersFront}}</div>
                     ''',
                     'afmt': '''
                         <div class="question-number">Frage {{QuestionNumber}}</div>
@@ -105,20 +118,7 @@ class AnkiDeckGenerator:
                         </div>
                         {{/Image}}
                         <hr>
-                        <div class="answers">
-                            <div class="answer {{#IsACorrect}}correct{{/IsACorrect}}">
-                                A) {{AnswerA}}
-                                {{#IsACorrect}}<span class="checkmark">✓</span>{{/IsACorrect}}
-                            </div>
-                            <div class="answer {{#IsBCorrect}}correct{{/IsBCorrect}}">
-                                B) {{AnswerB}}
-                                {{#IsBCorrect}}<span class="checkmark">✓</span>{{/IsBCorrect}}
-                            </div>
-                            <div class="answer {{#IsCCorrect}}correct{{/IsCCorrect}}">
-                                C) {{AnswerC}}
-                                {{#IsCCorrect}}<span class="checkmark">✓</span>{{/IsCCorrect}}
-                            </div>
-                        </div>
+                        <div class="answers">{{AnswersHTML}}</div>
                         {{#Explanation}}
                         <hr>
                         <div class="explanation">{{Explanation}}</div>
@@ -185,16 +185,16 @@ class AnkiDeckGenerator:
 
         # Main deck will be created on demand
 
-    def _get_topic_from_question_number(self, question_number: str) -> str:
-        """Extract topic from question number."""
-        prefix = question_number[0]
-        return self.TOPIC_MAPPING.get(prefix, 'Unknown')
+    @classmethod
+    def _get_topic_from_question_number(cls, question_number: str) -> str:
+        """Extract topic from question number (its first character)."""
+        return cls.TOPIC_MAPPING.get(question_number[:1], 'Unknown')
 
     def _get_or_create_deck(self, topic: str) -> genanki.Deck:
         """Get or create a subdeck for the given topic."""
         if topic not in self.decks:
-            # Generate unique deck ID based on topic
-            deck_id = self.BASE_DECK_ID + hash(topic) % 1000000
+            # Look up the stable deck ID for the topic
+            deck_id = self.DECK_IDS[topic]
             # Use :: syntax for Anki subdecks
             deck_name = f"{self.deck_name}::{topic}"
             self.decks[topic] = genanki.Deck(deck_id, deck_name)
@@ -202,53 +202,66 @@ class AnkiDeckGenerator:
 
     def add_question(
         self,
+        deck: genanki.Deck,
         question_data: Question,
-        image_path: Optional[Path] = None
+        image_filename: Optional[str] = None
     ) -> None:
-        """Add a question to the appropriate topic deck."""
+        """Add a question to its topic deck.
 
-        # Get topic and corresponding deck
-        topic = self._get_topic_from_question_number(question_data.number)
-        deck = self._get_or_create_deck(topic)
+        image_filename is the question's image as found in the images
+        directory, or None if it has no image or the file is missing.
+        """
 
         # Prepare image field - store as HTML img tag
         image_field = ""
-        if question_data.image:
-            image_field = f'<img src="{question_data.image}" style="max-width: 400px; max-height: 300px;">'
-
-        # Get answers
-        answer_a = question_data.answers.get('A', '')
-        answer_b = question_data.answers.get('B', '')
-        answer_c = question_data.answers.get('C', '')
+        if image_filename:
+            image_field = f'<img src="{image_filename}" style="max-width: 400px; max-height: 300px;">'
 
-        # Determine which answer is correct
+        # Render answers A, B, C twice: unmarked for the front side, and with
+        # the correct one marked up for the back side
+        answers = question_data.answers
         correct = question_data.correct_answer
-        is_a_correct = '1' if correct == 'A' else ''
-        is_b_correct = '1' if correct == 'B' else ''
-        is_c_correct = '1' if correct == 'C' else ''
-
-        # Create note
+        front_divs = []
+        back_divs = []
+        for letter in 'ABC':
+            # The answer text is plain text from the PDF, not markup
+            text = html.escape(answers.get(letter, ''))
+            front_divs.append(f'<div class="answer">{letter}) {text}</div>')
+            if letter == correct:
+                back_divs.append(
+                    f'<div class="answer correct">{letter}) {text}'
+                    '<span class="checkmark">✓</span></div>'
+                )
+            else:
+                back_divs.append(f'<div class="answer">{letter}) {text}</div>')
+        answers_front = ''.join(front_divs)
+        answers_html = ''.join(back_divs)
+
+        # Create note; the question number is the note's stable identity, so
+        # the GUID is derived from it (namespaced to this deck) and rebuilding
+        # the deck updates existing notes instead of duplicating them
         note = genanki.Note(
             model=self.model,
-            fields=[
+            fields=(
                 question_data.number,
                 question_data.question,
                 image_field,
-                answer_a,
-                answer_b,
-                answer_c,
-                question_data.correct_answer or '',
-                is_a_correct,
-                is_b_correct,
-                is_c_correct,
+                answers_front,
+                answers_html,
+                correct or '',
                 '',  # Explanation (empty for now)
-            ]
+            ),
+            guid=genanki.guid_for('fishing_exam', question_data.number)
         )
 
         deck.add_note(note)
 
-    def save(self, output_path: Path, media_files: List[Path]) -> None:
-        """Save all topic subdecks as one .apkg file."""
+    def save(self, output_path: Path, media_files: List[str]) -> None:
+        """Save all topic subdecks as one .apkg file.
+
+        media_files must only contain existing files; main checks them
+        against the images directory before adding them.
+        """
         if not self.decks:
             click.echo("No decks created. No questions were added.")
             return
@@ -259,8 +272,7 @@ class AnkiDeckGenerator:
 
         # Add media files (images)
         if media_files:
-            valid_media = [str(f) for f in media_files if f.exists()]
-            package.media_files = valid_media
+            package.media_files = media_files
 
         # Save the package
         package.write_to_file(str(output_path))
@@ -278,7 +290,7 @@ class AnkiDeckGenerator:
 @click.option(
     '--images-dir',
     default='images',
-    type=click.Path(exists=True),
+    type=click.Path(exists=True, file_okay=False),
     help='Directory containing question images'
 )
 @click.option(
@@ -300,50 +312,50 @@ def main(input_file: str, images_dir: str, output: str, deck_name: str) -> None:
 
         click.echo(f"Loading questions from {input_path}...")
 
-        # Load questions
-        with input_path.open('r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Extract questions from the new JSON structure
-        questions_data = data['questions']
+        # Load and validate questions in one pydantic-core pass over the JSON
+        questions = ExamInput.model_validate_json(input_path.read_bytes()).questions
 
-        click.echo(f"Found {len(questions_data)} questions")
+        click.echo(f"Found {len(questions)} questions")
 
         # Create deck generator
         generator = AnkiDeckGenerator(deck_name)
 
-        # Collect media files
+        # Collect media files, checking names against one listing of the
+        # images directory instead of stat'ing each file
         media_files = []
+        available_images = {p.name for p in images_path.iterdir()}
+        # genanki takes media as path strings, so build those directly
+        images_dir_str = str(images_path)
 
-        # Add questions to deck
-        for q_data in questions_data:
-            question = Question(**q_data)
-
-            # Find image file if it exists
-            image_path = None
-            if question.image:
-                image_path = images_path / question.image
-                if image_path.exists():
-                    media_files.append(image_path)
-                else:
-                    click.echo(f"Warning: Image file not found: {image_path}")
-
-            generator.add_question(question, image_path)
-
-        click.echo(f"Added {len(questions_data)} questions to decks")
-        click.echo(f"Including {len(media_files)} images")
-
-        # Display topic distribution and check for unknown topics
-        topic_counts = {}
-        unknown_questions = []
-
-        for q_data in questions_data:
-            question = Question(**q_data)
+        # Group questions by topic so that each subdeck is created once
+        questions_by_topic = defaultdict(list)
+        for question in questions:
             topic = generator._get_topic_from_question_number(question.number)
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
-
-            if topic == 'Unknown':
-                unknown_questions.append(question.number)
+            questions_by_topic[topic].append(question)
+
+        # Add questions to deck, one topic at a time
+        for topic, topic_questions in questions_by_topic.items():
+            deck = generator._get_or_create_deck(topic)
+
+            for question in topic_questions:
+                # Find image file if it exists
+                image_filename = None
+                if question.image:
+                    image_path = f'{images_dir_str}/{question.image}'
+                    if question.image in available_images:
+                        image_filename = question.image
+                        media_files.append(image_path)
+                    else:
+                        click.echo(f"Warning: Image file not found: {image_path}")
+
+                generator.add_question(deck, question, image_filename)
+
+        # Topic distribution and questions without a known topic
+        topic_counts = {topic: len(qs) for topic, qs in questions_by_topic.items()}
+        unknown_questions = [q.number for q in questions_by_topic.get('Unknown', ())]
+
+        click.echo(f"Added {len(questions)} questions to decks")
+        click.echo(f"Including {len(media_files)} images")
 
         click.echo("\nQuestions per topic:")
         for topic, count in sorted(topic_counts.items()):